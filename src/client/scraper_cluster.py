@@ -0,0 +1,169 @@
+# Imported libraries
+import asyncio
+import multiprocessing
+import os
+import queue
+from typing import Dict, List
+
+from src.client.tiktok_client import TikTokClient
+from src.utils.logger import setup_logger
+
+# Public surface of this module
+__all__ = ['ScraperCluster']
+
+
+def _worker_main(in_queue, out_queue, config: Dict) -> None:
+    """
+    Entry point of one worker process: run the async worker loop.
+
+    Args:
+        in_queue: Queue of tags to scrape (None is the stop signal)
+        out_queue: Queue the worker puts (tag, result) tuples on
+        config: TikTokClient configuration for this worker
+    """
+    asyncio.run(_worker_loop(in_queue, out_queue, config))
+
+
+async def _worker_loop(in_queue, out_queue, config: Dict) -> None:
+    """
+    Drain tags from the input queue through one TikTokClient.
+
+    Each worker process owns its own event loop, browser, and context
+    pool, so the cluster scales across CPU cores instead of piling all
+    pages onto a single Chromium renderer.
+
+    Args:
+        in_queue: Queue of tags to scrape (None is the stop signal)
+        out_queue: Queue the worker puts (tag, result) tuples on
+        config: TikTokClient configuration for this worker
+    """
+    # Each worker logs to its own pid-suffixed file - several processes
+    # appending to one file through the buffered handler would interleave
+    # partial lines
+    logger = setup_logger(f'ScraperWorker-{os.getpid()}')
+
+    try:
+        async with TikTokClient(logger, config) as client:
+            while True:
+                tag = in_queue.get()
+
+                # None means no more work; shut this worker down
+                if tag is None:
+                    break
+
+                result = await client.fetch_hashtag_page(tag)
+                out_queue.put((tag, result))
+    finally:
+        # Always announce that this worker is done, even on a crash, so
+        # the parent's collection loop doesn't wait for it forever
+        out_queue.put(None)
+
+
+# Setting up class
+class ScraperCluster:
+    def __init__(self, logger, config: Dict, num_workers: int = 4) -> None:
+        """
+        Initialize a cluster of scraper worker processes.
+
+        A single Chromium instance becomes render-thread bound past a few
+        dozen concurrent pages, so for big sweeps we fan out across
+        processes instead: each worker hosts one TikTokClient with its own
+        event loop and browser, and tags are dispatched over a queue.
+
+        Args:
+            logger: Logger instance for cluster-level progress and errors
+
+            config: TikTokClient configuration handed to every worker
+
+            num_workers: Number of worker processes to spawn
+        """
+        # Store the logger instance so it can be used throughout the class
+        self.logger = logger
+
+        # Configuration each worker builds its TikTokClient from
+        self.config = config
+
+        # How many worker processes to run
+        self.num_workers = num_workers
+
+        # 'spawn' keeps workers from inheriting (and corrupting) the
+        # parent's Playwright Node driver the way 'fork' would
+        self._mp_context = multiprocessing.get_context('spawn')
+
+        # Log that we've initialized the cluster
+        self.logger.info("Scraper cluster initialized with %d workers", num_workers)
+
+    def scrape(self, tags: List[str]) -> Dict[str, bool]:
+        """
+        Scrape a batch of hashtags across the worker processes.
+
+        Args:
+            tags: List of hashtags to fetch (without the # symbol)
+
+        Returns:
+            Dict[str, bool]: Mapping of each tag to whether its page loaded
+        """
+        if not tags:
+            return {}
+
+        # Work and result channels shared with the workers
+        in_queue = self._mp_context.Queue()
+        out_queue = self._mp_context.Queue()
+
+        # Spawn the workers first so they're warming up their browsers
+        # while we enqueue the work
+        workers = [
+            self._mp_context.Process(
+                target=_worker_main,
+                args=(in_queue, out_queue, self.config)
+            )
+            for _ in range(self.num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # Queue all the tags, then one stop signal per worker
+        for tag in tags:
+            in_queue.put(tag)
+        for _ in workers:
+            in_queue.put(None)
+
+        # Collect results until every worker has either sent its done
+        # sentinel or died. Blocking on exactly len(tags) gets with no
+        # timeout would hang forever if a worker crashed mid-tag.
+        results: Dict[str, bool] = {}
+        finished = 0
+        while finished < len(workers):
+            try:
+                item = out_queue.get(timeout=1.0)
+            except queue.Empty:
+                # Nothing arrived; if no worker is alive anymore, the
+                # missing sentinels are never coming
+                if not any(worker.is_alive() for worker in workers):
+                    self.logger.error(
+                        "Workers exited without finishing; %d of %d tags collected",
+                        len(results), len(tags)
+                    )
+                    break
+                continue
+
+            if item is None:
+                # One worker has drained its share and shut down
+                finished += 1
+            else:
+                tag, result = item
+                results[tag] = result
+
+        # Wait for the workers to exit, forcing any stragglers
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+
+        # Tags lost to a crashed worker count as failed fetches
+        for tag in tags:
+            results.setdefault(tag, False)
+
+        self.logger.info("Cluster scraped %d tags", len(tags))
+        return results
@@ -1,5 +1,251 @@
-from playwright.sync_api import sync_playwright
-from typing import Dict
+import asyncio
+import random
+import re
+import threading
+from functools import lru_cache
+
+from playwright.async_api import async_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from types import MappingProxyType
+from typing import Dict, List
+
+# Public surface of this module; keeps linters honest if a duplicate
+# definition ever sneaks back in
+__all__ = ['TikTokClient', 'ContextPool']
+
+
+# Default context settings, built once at import. The read-only proxy is the
+# source of truth; call sites copy it into a plain dict when Playwright needs
+# a mutable mapping.
+_DEFAULT_VIEWPORT = MappingProxyType({'width': 1920, 'height': 1080})
+_DEFAULT_UA = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Bound .format beats re-parsing an f-string template on every fetch
+_URL_TEMPLATE = "https://www.tiktok.com/tag/{}".format
+
+
+@lru_cache(maxsize=1024)
+def _tag_pattern(tag: str):
+    """
+    Compile (and cache) the landed-URL pattern for a hashtag.
+
+    Anchoring on the /tag/ path segment fixes the old substring test,
+    which accepted e.g. tag='cat' landing on /tag/catastrophe, and a
+    single compiled match replaces two .lower() allocations per check.
+
+    Args:
+        tag: The hashtag to build the pattern for (without the # symbol)
+
+    Returns:
+        re.Pattern: Compiled pattern matching the tag's hashtag-page URLs
+    """
+    return re.compile(
+        rf"^https?://www\.tiktok\.com/tag/{re.escape(tag.lower())}(?:[/?#]|$)",
+        re.IGNORECASE
+    )
+
+
+# Process-wide Playwright driver and browser, shared by every TikTokClient.
+# Starting the driver spawns a Node subprocess and launching Chromium costs
+# hundreds of ms, so we pay both once and refcount them across clients.
+_PW = None
+_BROWSER = None
+_REFCOUNT = 0
+# Event loop the shared browser belongs to; its connection can only be
+# awaited from this loop, so a new loop must start over
+_LOOP = None
+# Guards the globals above and the per-loop lock table below
+_LOCK = threading.Lock()
+# One asyncio.Lock per running event loop - an asyncio.Lock binds to the
+# loop it is first awaited on, so a single module-level one would make
+# every asyncio.run() after the first raise RuntimeError
+_LOOP_LOCKS: Dict = {}
+
+
+def _loop_lock() -> asyncio.Lock:
+    """
+    Get (creating lazily) the asyncio lock for the running event loop.
+
+    Returns:
+        asyncio.Lock: A lock safe to await on the current loop
+    """
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        # Forget locks whose loops have finished so the table stays small
+        for stale in [l for l in _LOOP_LOCKS if l.is_closed()]:
+            del _LOOP_LOCKS[stale]
+
+        lock = _LOOP_LOCKS.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            _LOOP_LOCKS[loop] = lock
+        return lock
+
+
+async def _ensure_browser(config: Dict):
+    """
+    Start the shared Playwright driver and browser on first use.
+
+    The first caller's config decides launch options (e.g. headless);
+    later callers just reuse the already-running browser. A browser left
+    behind by a finished event loop can't be awaited anymore, so it is
+    discarded and relaunched for the new loop.
+
+    Args:
+        config: Client configuration dictionary (reads 'headless')
+
+    Returns:
+        Browser: The shared browser instance
+    """
+    global _PW, _BROWSER, _REFCOUNT, _LOOP
+
+    loop = asyncio.get_running_loop()
+    async with _loop_lock():
+        # Stale instance from a previous loop: its connection is dead to
+        # us (nothing from that loop can be awaited here), so drop the
+        # references and start fresh on this loop
+        if _BROWSER is not None and _LOOP is not loop:
+            _PW = None
+            _BROWSER = None
+            _REFCOUNT = 0
+
+        if _BROWSER is None:
+            _PW = await async_playwright().start()
+            _BROWSER = await _PW.chromium.launch(
+                headless=config.get('headless', True)
+            )
+            _LOOP = loop
+        _REFCOUNT += 1
+        return _BROWSER
+
+
+async def _release_browser() -> None:
+    """
+    Drop one reference to the shared browser, shutting everything down
+    (browser then driver) when the last client releases it.
+    """
+    global _PW, _BROWSER, _REFCOUNT, _LOOP
+
+    loop = asyncio.get_running_loop()
+    async with _loop_lock():
+        # A browser owned by a different loop can't be closed from here;
+        # _ensure_browser discards it when that loop is gone
+        if _LOOP is not loop:
+            return
+        if _REFCOUNT == 0:
+            return
+        _REFCOUNT -= 1
+        if _REFCOUNT == 0:
+            if _BROWSER:
+                await _BROWSER.close()
+                _BROWSER = None
+            if _PW:
+                await _PW.stop()
+                _PW = None
+            _LOOP = None
+
+
+# Pool of reusable browser contexts
+class ContextPool:
+    """
+    Keeps a set of pre-warmed BrowserContext objects around a single Browser.
+
+    Creating a context costs hundreds of ms (viewport/user-agent setup,
+    incognito-like state init), so paying that once per context and reusing
+    them is much cheaper than calling new_context for every request.
+    """
+
+    def __init__(self, browser, max_size: int, context_kwargs: Dict,
+                 route_handler=None, warmup_url=None) -> None:
+        """
+        Initialize the pool around an already-launched browser.
+
+        Args:
+            browser: The shared Browser instance contexts are created from
+            max_size: Maximum number of contexts the pool will ever create
+            context_kwargs: Keyword arguments passed to browser.new_context
+                            (viewport, user agent, etc.)
+            route_handler: Optional async handler installed on every new
+                           context via context.route("**/*", handler)
+            warmup_url: Optional URL each new context visits once before
+                        use, priming DNS and the TLS session ticket
+        """
+        # The single shared browser all pooled contexts belong to
+        self.browser = browser
+
+        # Cap on how many contexts we'll create in total
+        self.max_size = max_size
+
+        # Settings each context is created with
+        self.context_kwargs = context_kwargs
+
+        # Request filter to install on each freshly created context
+        self.route_handler = route_handler
+
+        # URL fresh contexts navigate to once before serving requests
+        self.warmup_url = warmup_url
+
+        # Idle contexts waiting to be handed out
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+        # How many contexts exist so far (idle + in use)
+        self._created = 0
+
+    async def acquire(self):
+        """
+        Get a context from the pool, creating one lazily if we're under the cap.
+
+        Returns:
+            BrowserContext: A ready-to-use context (caller must release it)
+        """
+        # If nothing is idle but we still have headroom, create a new context
+        if self._queue.empty() and self._created < self.max_size:
+            self._created += 1
+            context = await self.browser.new_context(**self.context_kwargs)
+            # New contexts get the same request filter as the main one
+            if self.route_handler:
+                await context.route("**/*", self.route_handler)
+            # Prime DNS/TLS before the context serves its first request,
+            # so that cost lands here instead of on the measured fetch
+            if self.warmup_url:
+                page = await context.new_page()
+                try:
+                    await page.goto(self.warmup_url, wait_until='commit',
+                                    timeout=5000)
+                except Exception:
+                    # Warmup is best-effort; a miss just means the first
+                    # real navigation pays the handshake itself
+                    pass
+                finally:
+                    await page.close()
+            return context
+
+        # Otherwise wait for a context to be released back to us
+        return await self._queue.get()
+
+    async def release(self, context) -> None:
+        """
+        Return a context to the pool after use.
+
+        Args:
+            context: The context previously handed out by acquire()
+        """
+        # Wipe cookies so the next user starts from a clean slate
+        await context.clear_cookies()
+
+        # Put it back in the idle queue
+        await self._queue.put(context)
+
+    async def close(self) -> None:
+        """
+        Drain the pool and close every idle context.
+        Should be called during client cleanup.
+        """
+        while not self._queue.empty():
+            context = self._queue.get_nowait()
+            await context.close()
+        self._created = 0
 
 
 # Setting up class
@@ -8,11 +254,11 @@ class TikTokClient:
         """
         Initialize TikTok client with logging and configuration.
 
-        Args: 
-            logger: Logger instance from utils/logger.py that we'll use for tracking what our client is doing and 
+        Args:
+            logger: Logger instance from utils/logger.py that we'll use for tracking what our client is doing and
                     any errors that occur
 
-            config: Dictionary containing settings like whether to run headless, 
+            config: Dictionary containing settings like whether to run headless,
                     rate limits, etc.
         """
         # Store the logger instance so it can be used throughout the class
@@ -21,34 +267,49 @@ class TikTokClient:
         # Store the cofiguration dictionary for later us
         self.config = config
 
+        # Resolve the hot-path settings once here so start() and the
+        # fetch paths never do dict lookups for them again
+        self._headless: bool = bool(config.get('headless', True))
+        self._viewport = config.get('viewport', _DEFAULT_VIEWPORT)
+        self._user_agent: str = config.get('user_agent', _DEFAULT_UA)
+        self._nav_timeout_ms: int = int(config.get('nav_timeout_ms', 3000))
+        self._block_types = frozenset(
+            config.get('block_types', {'image', 'media', 'font', 'stylesheet'})
+        )
+
         # Browser attributes to be properly initialised later, set to `None` for now.
-        # Will hold browser instance
+        # Will hold the (shared, refcounted) browser instance
         self.browser = None
         # Will hold browser context (like an incognito window)
         self.context = None
         # Will hold the actual page we're interacting with
         self.page = None
+        # Will hold the pool of reusable contexts for hashtag fetches
+        self.pool = None
+        # Will hold this client's own driver in persistent-context mode
+        # (shared-browser mode keeps the driver in the module singleton)
+        self._playwright = None
 
         # Log that we've initialized the client
         self.logger.info("TikTok client initialized")
 
-    def __enter__(self):
+    async def __aenter__(self):
         """
-        Called when entering a 'with' block.
+        Called when entering an 'async with' block.
         Example:
-            with TikTokClient(logger, config) as client:
-                # __enter__ is called here
+            async with TikTokClient(logger, config) as client:
+                # __aenter__ is called here
                 # self.start() runs automatically
         """
 
         # Start browser session
-        self.start()
+        await self.start()
         # Return self so the client can be used in the with block
         return self
 
-    def __exit__(self, exc_type, exc_value, traceback):
+    async def __aexit__(self, exc_type, exc_value, traceback):
         """
-        Called when exiting a 'with' block, even if an error occurred.
+        Called when exiting an 'async with' block, even if an error occurred.
 
         Args:
             exc_type: Type of exception that occurred (if any)
@@ -56,82 +317,198 @@ class TikTokClient:
             traceback: Traceback of exception that occurred (if any)
 
         Example:
-            with TikTokClient(logger, config) as client:
+            async with TikTokClient(logger, config) as client:
                 # do stuff
-                # __exit__ is called here, running cleanup automatically
+                # __aexit__ is called here, running cleanup automatically
         """
 
         # Logs if cleaning up after an error
         if exc_type is not None:
             self.logger.warning(
-                f"Cleaning up after error: {exc_type.__name__}: {exc_value}"
+                "Cleaning up after error: %s: %s", exc_type.__name__, exc_value
             )
 
-        self.cleanup()  # Clean up resources
+        await self.cleanup()  # Clean up resources
 
-    def start(self) -> None:
+    async def start(self) -> None:
         """
         Start the browser session with basic configuration.
         Sets up browser, context, and page with proper error handling.
+
+        When config['user_data_dir'] is set, the client launches a
+        persistent context with an on-disk profile instead, so TikTok's
+        HTTP/ServiceWorker/DNS caches survive between runs and repeat
+        scrapes skip re-downloading static assets. Parallel workers must
+        each use their own directory - Chromium locks the profile.
         """
         try:
-            # Start a Playwright instance
-            playwright = sync_playwright().start()
-
-            # Launch a browser (Using Chrome/Chromium in this case)
-            # headless=True means no visible browser window (runs in background)
-            self.browser = playwright.chromium.launch(
-                headless=self.config.get('headless', True)
-            )
-
-            # Creates a new browser context with specific viewport size
-            # This will help make automation more consistent
-            self.context = self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                # Sets a common user agent to mak requests look more natural
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
+            user_data_dir = self.config.get('user_data_dir')
+
+            if user_data_dir:
+                # Persistent mode: the profile (and its caches) lives on
+                # disk, so this client gets its own driver and a combined
+                # browser+context launch instead of the shared browser
+                self._playwright = await async_playwright().start()
+                self.context = await self._playwright.chromium.launch_persistent_context(
+                    user_data_dir,
+                    headless=self._headless,
+                    viewport=dict(self._viewport),
+                    user_agent=self._user_agent
+                )
+                # Playwright exposes no separate Browser object for a
+                # persistent context, so browser (and the pool) stay None
+                self.browser = self.context.browser
+            else:
+                # Grab the process-wide browser, starting the Playwright
+                # driver and launching Chromium only if no other client has
+                self.browser = await _ensure_browser(self.config)
+
+                # Creates a new browser context with specific viewport size
+                # This will help make automation more consistent
+                self.context = await self.browser.new_context(
+                    viewport=dict(self._viewport),
+                    # Sets a common user agent to mak requests look more natural
+                    user_agent=self._user_agent
+                )
+
+            # Abort requests for resource types we never use (images, video,
+            # fonts, ...) before they hit the network - the workload is
+            # bandwidth-bound, so dropping them shortens every page load
+            await self.context.route("**/*", self._router)
+
+            # Only wait on navigations briefly by default; hashtag checks
+            # never need the full page (media, trackers) to finish loading
+            self.context.set_default_navigation_timeout(self._nav_timeout_ms)
 
             # Create a new page in the browser context
-            self.page = self.context.new_page()
+            self.page = await self.context.new_page()
+
+            # One throwaway navigation primes the DNS resolver cache and
+            # TLS session ticket, moving ~100-300 ms of handshake cost off
+            # the first real fetch and onto startup
+            if self.config.get('warmup', True):
+                try:
+                    await self.page.goto("https://www.tiktok.com/",
+                                         wait_until='commit', timeout=5000)
+                except Exception:
+                    # Best-effort: a failed warmup just means the first
+                    # fetch pays the handshake itself
+                    pass
+
+            # Build the context pool hashtag fetches draw from, so each
+            # request reuses a warmed context instead of creating its own.
+            # Persistent mode has no Browser object to pool around, so
+            # fetches use pages on the persistent context instead.
+            if self.browser:
+                self.pool = ContextPool(
+                    self.browser,
+                    max_size=self.config.get('pool_size', 4),
+                    context_kwargs={
+                        'viewport': dict(self._viewport),
+                        'user_agent': self._user_agent
+                    },
+                    route_handler=self._router,
+                    warmup_url=("https://www.tiktok.com/"
+                                if self.config.get('warmup', True) else None)
+                )
 
             # Log that browser has launched successfully
             self.logger.info("Browser launched successfully")
 
         except Exception as e:
             # Log any errors that occur during startup
-            self.logger.error(f"Failed to start browser session: {str(e)}")
+            self.logger.error("Failed to start browser session: %s", e)
+
+    async def _router(self, route) -> None:
+        """
+        Decide per request whether it ever hits the network.
 
-    def cleanup(self) -> None:
+        Hashtag validation only needs the document itself, so images, video,
+        fonts and stylesheets are aborted before download. The blocked set
+        can be overridden via config['block_types'].
+
+        Args:
+            route: The Playwright Route object for an intercepted request
+        """
+        if route.request.resource_type in self._block_types:
+            # Abort before any bytes are transferred
+            await route.abort()
+        else:
+            # Let everything else through untouched
+            await route.continue_()
+
+    async def cleanup(self) -> None:
         """
         Clean up browser resources in reverse order of creation.
         Should be called when done with the client to free up system resources.
         """
         try:
-            # Closes page if it exists
-            if self.page:
-                self.page.close()
-                self.page = None
-
-            # Closes context if it exists
-            if self.context:
-                self.context.close()
-                self.context = None
-
-            # Closes browser if it exists
-            if self.browser:
-                self.browser.close()
+            # Each close() is a round-trip to the Playwright driver, so
+            # issue the page and context closes concurrently instead of
+            # awaiting them one after the other
+            to_close = [x.close() for x in (self.page, self.context) if x]
+            if to_close:
+                await asyncio.gather(*to_close, return_exceptions=True)
+            self.page = None
+            self.context = None
+
+            # Drains and closes the pooled contexts if the pool exists
+            if self.pool:
+                await self.pool.close()
+                self.pool = None
+
+            if self._playwright:
+                # Persistent mode: this client owns its driver; closing
+                # the context above already shut the profile down
+                await self._playwright.stop()
+                self._playwright = None
+                self.browser = None
+            elif self.browser:
+                # Release our reference to the shared browser; it only
+                # actually closes (with the driver) when the last client
+                # lets go
+                await _release_browser()
                 self.browser = None
 
             self.logger.info("Browser resources cleaned up successfully")
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {str(e)}")
+            self.logger.error("Error during cleanup: %s", e)
 
-    def fetch_hashtag_page(self, tag: str) -> bool:
+    async def fetch_hashtag_page(self, tag: str) -> bool:
         """
         Navigate to a TikTok hashtag page.
 
+        By default ('reuse_page': True) the persistent page is navigated in
+        place - for sequential same-origin fetches, reusing one page beats
+        recreating them because Chromium keeps its parsed JS and resource
+        caches warm. Set 'reuse_page' to False to borrow a pooled context
+        and a throwaway page instead, which is what concurrent fetches need.
+
+        Args:
+            tag: The hashtag to search for (without the # symbol)
+
+        Returns:
+            bool: True if navigation was successful, False otherwise
+        """
+
+        if self.config.get('reuse_page', True):
+            # Safety check
+            if self.page is None:
+                self.logger.error(
+                    "Browser not started. Use 'async with' statement or call start() first")
+                return False
+
+            # Sequential mode: navigate the persistent page in place
+            return await self._navigate_and_check(self.page, tag)
+
+        # Concurrent mode: isolated page on a pooled context
+        return await self._fetch_pooled(tag)
+
+    async def _fetch_pooled(self, tag: str) -> bool:
+        """
+        Fetch a hashtag page on a throwaway page from a pooled context.
+
         Args:
             tag: The hashtag to search for (without the # symbol)
 
@@ -139,30 +516,175 @@ class TikTokClient:
             bool: True if navigation was successful, False otherwise
         """
 
-        # Safety check
-        if self.page is None:
+        if self.pool is None:
+            # Persistent mode has no Browser object to pool around, but
+            # pages on the persistent context can still navigate
+            # concurrently - serve the fetch from a throwaway page there
+            if self.context is not None:
+                page = await self.context.new_page()
+                try:
+                    return await self._navigate_and_check(page, tag)
+                finally:
+                    await page.close()
+
+            # Safety check: no pool and no context means never started
             self.logger.error(
-                "Browser not started. Use 'with' statement or call start() first")
+                "Browser not started. Use 'async with' statement or call start() first")
             return False
 
+        # Borrow a warmed context from the pool instead of creating one
+        context = await self.pool.acquire()
+        page = None
+        try:
+            # Pages are cheap, so each pooled fetch gets a fresh one
+            page = await context.new_page()
+            return await self._navigate_and_check(page, tag)
+
+        finally:
+            # Close only the page; the context goes back to the pool
+            if page:
+                await page.close()
+            await self.pool.release(context)
+
+    async def _navigate_and_check(self, page, tag: str) -> bool:
+        """
+        Navigate a page to a hashtag URL and verify where it landed.
+
+        Args:
+            page: The page to navigate (persistent or pooled)
+            tag: The hashtag to search for (without the # symbol)
+
+        Returns:
+            bool: True if navigation was successful, False otherwise
+        """
+
         try:
             # Construct the hashtag URL - TikTok format is /tag/[hashtag]
-            url = f"https://www.tiktok.com/tag/{tag}"
+            url = _URL_TEMPLATE(tag)
 
-            # Navigate to the page
-            self.page.goto(url)
+            # Navigate to the page, retrying transient failures (429s,
+            # timeouts) with backoff so a flaky response doesn't force
+            # the caller to re-drive the whole pipeline
+            await self._goto_with_retry(page, url, tag)
 
             # Log success
-            self.logger.info(f"Navigated to hashtag: #{tag}")
+            self.logger.info("Navigated to hashtag: #%s", tag)
+
+            # Read the landed URL once - page.url crosses the Playwright
+            # driver boundary, so don't query it twice
+            current_url = page.url
 
-            # Basic check if we landed on the right page
-            if tag.lower() in self.page.url.lower():
+            # Check we landed on the tag's own page (anchored on the
+            # /tag/ path segment, so 'cat' doesn't match 'catastrophe')
+            if _tag_pattern(tag).match(current_url):
                 return True
             else:
                 self.logger.warning(
-                    f"Landed on unexpected URL: {self.page.url}")
+                    "Landed on unexpected URL: %s", current_url)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error navigating to #{tag}: {str(e)}")
+            self.logger.error("Error navigating to #%s: %s", tag, e)
             return False
+
+    async def _goto_with_retry(self, page, url: str, tag: str) -> None:
+        """
+        Navigate a page to a URL with bounded exponential-backoff retries.
+
+        TikTok frequently answers with transient 429s and timeouts, and
+        retrying inside the same warm context is far cheaper than the
+        caller tearing everything down and starting over. Navigation only
+        waits for the commit event (URL landed), not the full page load -
+        media/CSS/trackers never need to finish for hashtag validation.
+
+        Args:
+            page: The page to navigate
+            url: The URL to navigate to
+            tag: The hashtag the URL is for, used to recognise a landing
+                 that committed slowly but still arrived
+
+        Raises:
+            PlaywrightError: If every attempt fails
+        """
+        attempts = self.config.get('retry_attempts', 3)
+        base_delay = self.config.get('retry_base_ms', 200) / 1000
+        nav_timeout = self._nav_timeout_ms
+        last_error = None
+
+        for attempt in range(attempts):
+            try:
+                await page.goto(url, wait_until='commit', timeout=nav_timeout)
+                return
+            except PlaywrightTimeoutError as e:
+                # A slow commit can still mean we landed on the right
+                # URL; don't burn a retry on it if so. Same anchored
+                # pattern as the final check - a raw prefix comparison
+                # would accept /tag/catastrophe for tag='cat' again.
+                if _tag_pattern(tag).match(page.url):
+                    return
+                last_error = e
+            except PlaywrightError as e:
+                last_error = e
+
+            # Back off exponentially with a little jitter before retrying,
+            # unless this was the final attempt
+            if attempt < attempts - 1:
+                self.logger.warning(
+                    "Navigation to %s failed (attempt %d/%d): %s",
+                    url, attempt + 1, attempts, last_error
+                )
+                await asyncio.sleep(
+                    base_delay * (2 ** attempt) + random.random() * 0.1
+                )
+
+        raise last_error
+
+    async def fetch_many(self, tags: List[str], concurrency: int = 16) -> Dict[str, bool]:
+        """
+        Fetch several hashtag pages concurrently.
+
+        Page loads are network-bound, so overlapping them with asyncio gives
+        close to a linear speedup in the number of tags. Each fetch borrows a
+        context from the shared pool, so concurrent navigations stay isolated
+        without paying context-creation cost per tag.
+
+        Args:
+            tags: List of hashtags to fetch (without the # symbol)
+            concurrency: Maximum number of pages loading at the same time
+
+        Returns:
+            Dict[str, bool]: Mapping of each tag to whether its page loaded
+        """
+
+        # Safety check (persistent mode has no browser but does have a
+        # context, and its pages can serve concurrent fetches)
+        if self.browser is None and self.context is None:
+            self.logger.error(
+                "Browser not started. Use 'async with' statement or call start() first")
+            return {tag: False for tag in tags}
+
+        # Semaphore caps how many navigations are in flight at once
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Run all fetches concurrently and pair results back up with their tags
+        results = await asyncio.gather(
+            *(self._fetch_one(tag, semaphore) for tag in tags)
+        )
+        return dict(zip(tags, results))
+
+    async def _fetch_one(self, tag: str, semaphore: asyncio.Semaphore) -> bool:
+        """
+        Fetch a single hashtag page, bounded by the semaphore.
+
+        Args:
+            tag: The hashtag to search for (without the # symbol)
+            semaphore: Shared semaphore limiting in-flight navigations
+
+        Returns:
+            bool: True if navigation was successful, False otherwise
+        """
+
+        async with semaphore:
+            # Always use the pool here - the persistent page can't serve
+            # concurrent navigations regardless of the 'reuse_page' setting
+            return await self._fetch_pooled(tag)
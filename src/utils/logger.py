@@ -1,7 +1,165 @@
 # Imported libraries
+import atexit
+import io
 import logging
+import logging.handlers
+import queue
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict
+
+import orjson
+
+# Public surface of this module; keeps linters honest if a duplicate
+# definition ever sneaks back in
+__all__ = ['setup_logger', 'BufferedFileHandler', 'FastFormatter',
+           'OrjsonFormatter']
+
+
+# Formatter that writes one JSON object per line via orjson
+class OrjsonFormatter(logging.Formatter):
+    """
+    Emit each record as a single JSON line, serialized with orjson.
+
+    orjson is a C extension that serializes dicts several times faster
+    than stdlib json and ~10x faster than %-style string formatting, so
+    structured scrape data (tag, URL, timings) costs almost nothing to
+    log. Used on the file handler only; the console keeps the human-
+    readable format.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Render the record as a compact JSON line.
+
+        Args:
+            record: The log record to serialize
+
+        Returns:
+            str: One JSON object, no trailing newline
+        """
+        return orjson.dumps({
+            "t": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "fn": record.funcName,
+            "ln": record.lineno,
+            "msg": record.getMessage(),
+        }).decode()
+
+
+# Formatter that doesn't re-render the timestamp for every record
+class FastFormatter(logging.Formatter):
+    """
+    Formatter whose %(asctime)s is memoized per wall-clock second.
+
+    The stock formatter calls time.localtime + time.strftime for every
+    record, which shows up in profiles at high log rates. Our format only
+    has second resolution anyway, so the rendered string is cached and
+    recomputed only when int(record.created) changes - one strftime per
+    second instead of per record.
+    """
+
+    # Second the cached string was rendered for, and the string itself
+    _last_sec = -1
+    _last_str = ''
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        """
+        Render the record's timestamp, reusing the cached string when
+        the clock hasn't ticked over to a new second.
+
+        Args:
+            record: The log record being formatted
+            datefmt: Optional strftime format (defaults to the one the
+                     formatter was constructed with)
+
+        Returns:
+            str: The formatted timestamp
+        """
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime(
+                datefmt or self.datefmt or '%Y-%m-%d %H:%M:%S',
+                time.localtime(sec)
+            )
+        return self._last_str
+
+
+# File handler that batches writes instead of syscall-per-record
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler variant that writes through a large in-memory buffer.
+
+    The stock handler flushes after every record, costing one write()
+    syscall per log line - the dominant cost for a chatty scraper at
+    INFO level. This one batches records into ~64 KiB blocks and only
+    forces a flush for WARNING and above, so important lines still hit
+    disk immediately while bulk traffic is amortised.
+    """
+
+    def __init__(self, filename, mode: str = 'a', encoding=None,
+                 delay: bool = True, buffer_size: int = 65536) -> None:
+        """
+        Open (lazily, because of delay=True) a buffered log file.
+
+        Args:
+            filename: Path of the log file
+            mode: File mode, defaults to append
+            encoding: Text encoding, defaults to UTF-8
+            delay: Defer opening the file until the first record
+            buffer_size: Size of the write buffer in bytes
+        """
+        # Stash the buffer size before the base class calls _open()
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+
+    def _open(self):
+        """
+        Open the log file with a large binary write buffer underneath
+        a text wrapper, instead of the default line-ish buffering.
+        """
+        binary_mode = self.mode if 'b' in self.mode else self.mode + 'b'
+        buffered = open(self.baseFilename, binary_mode,
+                        buffering=self.buffer_size)
+        return io.TextIOWrapper(buffered, encoding=self.encoding or 'utf-8')
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write the record into the buffer, flushing only for WARNING+.
+
+        Args:
+            record: The log record to emit
+        """
+        try:
+            # Honour delay=True: open on first record
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write(self.format(record) + self.terminator)
+
+            # Warnings and errors are worth a syscall; INFO/DEBUG wait
+            # until the buffer fills (or flush/close/atexit)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+
+        except Exception:
+            self.handleError(record)
+
+
+# Loggers already configured by this process, keyed by name.
+# Repeated setup_logger calls return the cached instance instead of
+# re-opening log files and attaching fresh handlers.
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+# Handlers already built, keyed by (name, log_dir), so a log file is
+# opened at most once per process even if the logger cache is bypassed
+_HANDLER_CACHE: Dict[tuple, tuple] = {}
+
+# Log directories we've already created, so mkdir is one syscall per
+# process instead of one per setup_logger call
+_DIRS_MADE: set = set()
 
 
 # Setting up logger with both file and console output
@@ -13,35 +171,72 @@ def setup_logger(
     """
     Configure logging to both file and console with detailed formatting.
 
+    Log records are handed to a background QueueListener thread that owns
+    the real file and console handlers, so a log call on the hot path is
+    just a queue put - disk I/O never blocks the caller (important now
+    that TikTokClient runs on an asyncio event loop).
+
     Args:
         name (str): Logger name, defaults to 'MemeTracker'
         log_level (int): Logging level, defaults to DEBUG
         log_dir (str): Directory to store log files, defaults to 'logs'
 
     Returns:
-        logging.Logger: Configured logger instance that writes to both file 
+        logging.Logger: Configured logger instance that writes to both file
         and console with timestamp and context information
     """
 
-    # Create logs directory if it does not exist
+    # Return the already-configured logger if we've seen this name before
+    if name in _LOGGERS:
+        return _LOGGERS[name]
+
+    # Create logs directory if it does not exist (once per process)
     log_path = Path(log_dir)
-    log_path.mkdir(exist_ok=True)
+    if log_dir not in _DIRS_MADE:
+        log_path.mkdir(exist_ok=True)
+        _DIRS_MADE.add(log_dir)
 
-    # Creates a formatter with detailed information
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(name)s:%(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Reuse already-built handlers for this (name, log_dir) if we have
+    # them, so the log file is only ever opened once
+    cached = _HANDLER_CACHE.get((name, log_dir))
+    if cached is not None:
+        file_handler, console_handler = cached
+    else:
+        # Creates a formatter with detailed information.
+        # validate=True makes a bad field name (e.g. a '%(funcNamee)s' typo)
+        # fail loudly here at setup instead of raising per record and being
+        # swallowed by Handler.handleError on every log call.
+        formatter = FastFormatter(
+            '%(asctime)s - %(levelname)s - %(name)s:%(funcName)s:%(lineno)d - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+            validate=True
+        )
 
-    # Set up file handler with daily rotating logs
-    file_handler = logging.FileHandler(
-        log_path / f'{name.lower()}_{Path(__file__).stem}.log'
-    )
-    file_handler.setFormatter(formatter)
+        # Set up the buffered file handler; flush at exit so buffered
+        # INFO/DEBUG lines aren't lost on shutdown. The file gets JSON
+        # lines (cheap to serialize, easy to post-process); the console
+        # keeps the human-readable format above.
+        file_handler = BufferedFileHandler(
+            log_path / f'{name.lower()}_{Path(__file__).stem}.log'
+        )
+        file_handler.setFormatter(OrjsonFormatter())
+        atexit.register(file_handler.flush)
 
-    # Sets up console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+        # Sets up console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+
+        _HANDLER_CACHE[(name, log_dir)] = (file_handler, console_handler)
+
+    # Hot-path side of the handoff: an unbounded queue the logger puts
+    # records on, drained by a listener thread owning the real handlers
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
 
     # Gets the logger
     logger = logging.getLogger(name)
@@ -49,8 +244,15 @@ def setup_logger(
 
     # Prevents duplicate handlers
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Only the queue handler is attached; the listener thread fans
+        # records out to file and console off the critical path
+        logger.addHandler(queue_handler)
+
+    # Keep the listener reachable so tests and shutdown hooks can stop it
+    logger._listener = listener
+
+    # Remember the logger so repeated calls don't re-open the file
+    _LOGGERS[name] = logger
 
     # Log the initialisation
     logger.debug(
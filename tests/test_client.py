@@ -0,0 +1,19 @@
+# test_client.py (pure helpers only; nothing here needs a real browser)
+from src.client.tiktok_client import _tag_pattern, _URL_TEMPLATE
+
+
+def test_url_template():
+    assert _URL_TEMPLATE("dance") == "https://www.tiktok.com/tag/dance"
+
+
+def test_tag_pattern_matches_landed_urls():
+    pattern = _tag_pattern("cat")
+
+    # The tag's own page, with and without trailing parts
+    assert pattern.match("https://www.tiktok.com/tag/cat")
+    assert pattern.match("https://www.tiktok.com/tag/cat?lang=en")
+    assert pattern.match("https://www.tiktok.com/tag/CAT/")
+
+    # The old substring check wrongly accepted these
+    assert not pattern.match("https://www.tiktok.com/tag/catastrophe")
+    assert not pattern.match("https://www.tiktok.com/search?q=cat")
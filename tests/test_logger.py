@@ -19,6 +19,11 @@ def test_logger():
     info_logger.info("This info message should appear")
     info_logger.warning("This warning message should appear")
 
+    # File writes happen on the background listener thread now (and the
+    # file itself opens lazily), so wait for the queues to drain first
+    debug_logger._listener.queue.join()
+    info_logger._listener.queue.join()
+
     # Verify log files were created
     log_dir = Path("logs")
     assert log_dir.exists(), "Log directory wasn't created"
@@ -26,6 +31,27 @@ def test_logger():
     assert (log_dir / "testinfo_logger.log").exists(), "Info log file wasn't created"
 
 
+def test_formatter_handles_record():
+    # A formatter with a typo'd field name (e.g. funcNamee) would raise on
+    # every record; make sure every handler's formatter - in particular the
+    # console one, which carries the %-style format string that
+    # validate=True guards - renders a synthetic record cleanly
+    logger = setup_logger("TestFormat", logging.DEBUG)
+
+    record = logging.LogRecord(
+        name="TestFormat",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="synthetic record",
+        args=None,
+        exc_info=None,
+    )
+    for handler in logger._listener.handlers:
+        formatted = handler.formatter.format(record)
+        assert "synthetic record" in formatted
+
+
 if __name__ == "__main__":
     test_logger()
     print("Check the logs directory for output files!")